@@ -5,7 +5,9 @@ import pandas as pd
 from dataclasses import dataclass
 from seaborn._stats.base import Stat
 import statsmodels.api as sm
+from scipy import stats
 from typing import Optional
+from .split import GroupSplit
 
 
 @dataclass
@@ -32,11 +34,18 @@ class Lowess(Stat):
         The number of bootstrap samples to use for confidence intervals.
     alpha : float
         Confidence level for the intervals.
+    ci_method : str
+        How to compute “ymin”/“ymax”. "bootstrap" refits the smoother on
+        `num_bootstrap` resamples. "analytic" always returns intervals,
+        computed from the local-linear hat-matrix rows. It costs one extra
+        pass over the data points, like a robustness iteration (`delta` is
+        not used in this mode).
 
     Returns
     -------
     DataFrame
-        Columns “x”, “y” (smoothed) and, if bootstrapped, “ymin”/“ymax”.
+        Columns “x”, “y” (smoothed) and, if bootstrapped or analytic,
+        “ymin”/“ymax”.
     """
 
     frac: float = 0.2
@@ -45,6 +54,10 @@ class Lowess(Stat):
     it: int = 0
     num_bootstrap: Optional[int] = None
     alpha: float = 0.95
+    ci_method: str = "bootstrap"
+
+    # Upper bound on the number of hat-matrix entries computed at once
+    _chunk_size = 2 ** 20
 
     def __post_init__(self):
         # Type checking for the arguments
@@ -60,7 +73,11 @@ class Lowess(Stat):
             raise ValueError("iterations must be a non-negative integer.")
         if not isinstance(self.delta, float) or self.delta < 0:
             raise ValueError("delta must be a non-negative float.")
-        if self.num_bootstrap is None and self.alpha != 0.95:
+        if self.ci_method not in ("bootstrap", "analytic"):
+            raise ValueError("ci_method must be 'bootstrap' or 'analytic'.")
+        if self.ci_method == "analytic" and self.num_bootstrap is not None:
+            raise ValueError("num_bootstrap cannot be used with ci_method='analytic'.")
+        if self.ci_method == "bootstrap" and self.num_bootstrap is None and self.alpha != 0.95:
             self.num_bootstrap = 200
 
     def _fit_predict(self, data):
@@ -79,17 +96,110 @@ class Lowess(Stat):
             yy = result
         else:
             yy = result[:, 1]  # Select the predicted y-values
-        return pd.DataFrame(dict(x=xx, y=yy))
+        return dict(x=xx, y=yy)
+
+    def _hat_rows(self, x, xvals, k, robustness):
+        """
+        Yield (slice, window, rows, ok) of the local-linear hat matrix at `xvals`.
+
+        Mirrors statsmodels: `x` and `xvals` are sorted, each row is only
+        nonzero on the k-point window x[window], and `ok` is False where the
+        window has fewer than two positive weights.
+        """
+        n = len(x)
+        # Shift the window right while xval is past its midpoint
+        left = np.searchsorted((x[:n - k] + x[k:]) / 2.0, xvals, side="left")
+        offsets = np.arange(k)
+        step = max(1, self._chunk_size // k)
+        for start in range(0, len(xvals), step):
+            sl = slice(start, start + step)
+            window = left[sl, None] + offsets
+            xj = x[window]
+            xv = xvals[sl, None]
+            radius = np.maximum(xv - xj[:, :1], xj[:, -1:] - xv)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                w = np.abs(xj - xv) / radius
+            w = w * w * w
+            np.subtract(1, w, out=w)
+            w = w * w * w
+            if robustness is not None:
+                w *= robustness[window]
+            ok = (w > 1e-12).sum(axis=1) >= 2
+            if not ok.all():
+                w[~ok] = 0.0
+            w /= np.where(ok, w.sum(axis=1), 1.0)[:, None]
+            # Sequential sums, as in statsmodels: when all the weight sits on
+            # tied x values, sxx hits its floor and amplifies rounding in xbar
+            xbar = np.cumsum(w * xj, axis=1)[:, -1:]
+            xj -= xbar
+            sxx = np.maximum(np.cumsum(w * (xj * xj), axis=1)[:, -1:], 1e-12)
+            # Rows are w * (1 + (xval - xbar) * (x - xbar) / sxx)
+            xj *= xv - xbar
+            xj /= sxx
+            xj += 1
+            w *= xj
+            yield sl, window, w, ok
+
+    def _fit_points(self, x, y, k, robustness):
+        """Fit at the data points, returning the fit and the hat-matrix traces."""
+        n = len(x)
+        fitted = np.empty(n)
+        trace = trace_sq = 0.0
+        for sl, window, rows, ok in self._hat_rows(x, x, k, robustness):
+            # Where no regression is possible statsmodels uses y of the first
+            # point tied with x, copied across the ties (a unit hat row)
+            idx = np.arange(n)[sl]
+            first = np.searchsorted(x, x[sl], side="left")
+            fitted[sl] = np.where(ok, np.cumsum(rows * y[window], axis=1)[:, -1], y[first])
+            pos = idx - window[:, 0]
+            inside = pos < k
+            diag = np.where(inside, rows[np.arange(len(pos)), np.where(inside, pos, 0)], 0.0)
+            trace += np.where(ok, diag, first == idx).sum()
+            trace_sq += np.where(ok, (rows ** 2).sum(axis=1), 1.0).sum()
+        return fitted, trace, trace_sq
+
+    def _analytic_fit_predict(self, data) -> dict:
+        x = np.asarray(data["x"], dtype=float)
+        y = np.asarray(data["y"], dtype=float)
+        order = np.argsort(x)
+        x, y = x[order], y[order]
+        n = len(x)
+        k = min(n, max(2, int(self.frac * n + 1e-10)))
+        xx = np.linspace(x.min(), x.max(), self.gridsize)
 
-    def _bootstrap_resampling(self, data) -> pd.DataFrame:
-        xx = np.linspace(data["x"].min(), data["x"].max(), self.gridsize)
+        # Robustness weights, computed the same way as statsmodels
+        robustness = None
+        for _ in range(self.it):
+            fitted, _, _ = self._fit_points(x, y, k, robustness)
+            resid = np.abs(y - fitted)
+            median = np.median(resid)
+            resid = (resid > 0).astype(float) if median == 0 else np.minimum(resid / (6 * median), 1)
+            robustness = (1 - resid ** 2) ** 2
+
+        fitted, trace, trace_sq = self._fit_points(x, y, k, robustness)
+        dof = max(1.0, n - 2 * trace + trace_sq)
+        resid_sq = (y - fitted) ** 2
+        sigma = np.sqrt(np.sum(resid_sq if robustness is None else robustness * resid_sq) / dof)
+        crit = stats.t.ppf((1 + self.alpha) / 2, dof)
+
+        yy = np.full(len(xx), np.nan)
+        se = np.full(len(xx), np.nan)
+        for sl, window, rows, ok in self._hat_rows(x, xx, k, robustness):
+            yy[sl] = np.where(ok, np.cumsum(rows * y[window], axis=1)[:, -1], np.nan)
+            se[sl] = np.where(ok, sigma * np.sqrt((rows ** 2).sum(axis=1)), np.nan)
+
+        return dict(x=xx, y=yy, ymin=yy - crit * se, ymax=yy + crit * se)
+
+    def _bootstrap_resampling(self, data) -> dict:
+        x, y = data["x"], data["y"]
+        xx = np.linspace(x.min(), x.max(), self.gridsize)
         bootstrap_estimates = np.empty((self.num_bootstrap, len(xx)))
 
         for i in range(self.num_bootstrap):
-            sample = data.sample(frac=1, replace=True)
+            sample = np.random.randint(0, len(x), len(x))
             result = sm.nonparametric.lowess(
-                endog=sample["y"],
-                exog=sample["x"],
+                endog=y[sample],
+                exog=x[sample],
                 xvals=xx,
                 frac=self.frac,
                 delta=self.delta,
@@ -102,7 +212,10 @@ class Lowess(Stat):
         lower_bound = np.percentile(bootstrap_estimates, (1 - self.alpha) / 2 * 100, axis=0)
         upper_bound = np.percentile(bootstrap_estimates, (1 + self.alpha) / 2 * 100, axis=0)
 
-        return pd.DataFrame({"ymin": lower_bound, "ymax": upper_bound})
+        return {"ymin": lower_bound, "ymax": upper_bound}
+
+    def _bootstrap_fit_predict(self, data) -> dict:
+        return {**self._fit_predict(data), **self._bootstrap_resampling(data)}
 
     def __call__(self, data: pd.DataFrame, groupby, orient, scales) -> pd.DataFrame:
         if orient == "x":
@@ -121,22 +234,14 @@ class Lowess(Stat):
             raise ValueError(
                 f"`frac={self.frac:.3f}` is too small for only {n} distinct x‐values.\n"
                 f"LOWESS needs at least ~{k+1} points per window, so try `frac` ≥ {min_frac:.3f}."
-            )        
-        smoothed = self._fit_predict(df)
-
-        grouping_vars = [str(v) for v in data if v in groupby.order]
+            )
 
-        if not grouping_vars:
-            # If no grouping variables, directly fit and predict
-            smoothed = self._fit_predict(df)
+        if self.ci_method == "analytic":
+            fit_predict = self._analytic_fit_predict
+        elif self.num_bootstrap:
+            fit_predict = self._bootstrap_fit_predict
         else:
-            # Apply the fit_predict method for each group separately
-            smoothed = groupby.apply(df, self._fit_predict)
-
-        if self.num_bootstrap:
-            if not grouping_vars:
-                bootstrap_estimates = self._bootstrap_resampling(data)
-            else:
-                bootstrap_estimates = groupby.apply(data, self._bootstrap_resampling)
+            fit_predict = self._fit_predict
 
-        return smoothed.join(bootstrap_estimates[["ymin", "ymax"]]) if self.num_bootstrap else smoothed
+        # Fit each group separately (or all the data when there are no groups)
+        return GroupSplit(groupby, df, ["x", "y"]).apply(fit_predict, size=self.gridsize)
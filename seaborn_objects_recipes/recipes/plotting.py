@@ -7,6 +7,7 @@ import seaborn.objects as so
 import pandas as pd
 import numpy as np  
 from typing import Optional
+from .split import GroupSplit
 
 
 @dataclass
@@ -44,10 +45,10 @@ class PolyFitWithCI(Stat):
             raise ValueError("alpha must be a float between 0 and 1.")
         
     def _fit_predict(self, data):
-        x = data["x"].values
-        y = data["y"].values
+        x = data["x"]
+        y = data["y"]
         if x.size <= self.order:
-            xx = yy = []
+            xx = yy = ci_lower = ci_upper = []
         else:
             p = np.polyfit(x, y, self.order)
             xx = np.linspace(x.min(), x.max(), self.gridsize)
@@ -74,9 +75,7 @@ class PolyFitWithCI(Stat):
             ci_lower = yy - ci
             ci_upper = yy + ci
         
-        results = pd.DataFrame(dict(x=xx, y=yy, ymin=ci_lower, ymax=ci_upper))
-
-        return results
+        return dict(x=xx, y=yy, ymin=ci_lower, ymax=ci_upper)
     
     def __call__(self, data, groupby, orient, scales):
         # Rename columns to match expected input for _fit_predict
@@ -87,9 +86,9 @@ class PolyFitWithCI(Stat):
             xvar = data.columns[1]
             yvar = data.columns[0]
 
-        renamed_data = data.rename(columns={xvar: "x", yvar: "y"})  
+        renamed_data = data.rename(columns={xvar: "x", yvar: "y"}).dropna(subset=["x", "y"])
         return (
-            groupby
-            .apply(renamed_data.dropna(subset=["x", "y"]), self._fit_predict)
+            GroupSplit(groupby, renamed_data, ["x", "y"])
+            .apply(self._fit_predict, size=self.gridsize)
         )
 
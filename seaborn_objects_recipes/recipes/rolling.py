@@ -2,9 +2,11 @@ import dataclasses
 import operator
 from typing import ClassVar, Any
 
+import numpy as np
 import pandas as pd
 import seaborn.objects as so
 from seaborn._core.groupby import GroupBy
+from .split import GroupSplit
 
 @dataclasses.dataclass
 class Rolling(so.Move):
@@ -15,18 +17,18 @@ class Rolling(so.Move):
 
     group_by_orient: ClassVar[bool] = False
 
-    def _rolling(self, df: pd.DataFrame, var: str) -> pd.DataFrame:
+    def _rolling(self, data: dict[str, np.ndarray], var: str) -> dict[str, np.ndarray]:
         aggregate = operator.methodcaller(self.agg, **self.window_kwargs)
 
-        df[var] = aggregate(
-            df[var].rolling(
+        rolled = aggregate(
+            pd.Series(data[var]).rolling(
                 window=self.window,
                 min_periods=1,
                 win_type=self.window_type,
                 closed="neither",
             ),
         )
-        return df
+        return {var: rolled.to_numpy()}
 
     def __call__(
         self,
@@ -37,4 +39,4 @@ class Rolling(so.Move):
     ) -> pd.DataFrame:
         del scales
         other = {"x": "y", "y": "x"}[orient]
-        return groupby.apply(data, self._rolling, other)
+        return GroupSplit(groupby, data, [other]).transform(self._rolling, other)
@@ -0,0 +1,124 @@
+from __future__ import annotations
+from typing import Callable, Mapping, Sequence
+import numpy as np
+import pandas as pd
+from seaborn._core.groupby import GroupBy
+from seaborn._core.rules import categorical_order
+
+
+class GroupSplit:
+    """
+    Split a DataFrame into groups without materializing a DataFrame per group.
+
+    The rows are sorted by group once and the requested columns are gathered
+    into contiguous NumPy arrays, so each group is a set of views into them.
+    Results are written into preallocated output buffers and assembled into a
+    single DataFrame at the end. Groups, and rows within a group, come out in
+    the same order as with seaborn's `GroupBy.apply`.
+
+    Parameters
+    ----------
+    groupby : GroupBy
+        The grouping handed to the Stat or Move.
+    data : pd.DataFrame
+        The data to split.
+    columns : sequence of str
+        The columns passed to the applied function.
+    """
+
+    def __init__(self, groupby: GroupBy, data: pd.DataFrame, columns: Sequence[str]):
+        self.data = data
+
+        levels = {}
+        for var, order in groupby.order.items():
+            if var in data:
+                if order is None:
+                    order = categorical_order(data[var])
+                levels[var] = pd.Index(order)
+
+        # Flat group code of each row, in the order of the levels' Cartesian product
+        codes = np.zeros(len(data), dtype=np.intp)
+        valid = np.ones(len(data), dtype=bool)
+        for var, level in levels.items():
+            var_codes = level.get_indexer(data[var])
+            valid &= var_codes >= 0
+            codes = codes * len(level) + var_codes
+
+        shape = tuple(len(level) for level in levels.values())
+        codes = codes[valid]
+        counts = np.bincount(codes, minlength=int(np.prod(shape)))
+        present = np.flatnonzero(counts)
+
+        # A stable sort keeps the original row order within each group
+        self.index = np.flatnonzero(valid)[np.argsort(codes, kind="stable")]
+        self.offsets = np.concatenate([[0], np.cumsum(counts[present])])
+        self.keys = {}
+        if levels:
+            for (var, level), var_codes in zip(levels.items(), np.unravel_index(present, shape)):
+                self.keys[var] = level.take(var_codes).to_numpy()
+        self.values = {col: data[col].to_numpy()[self.index] for col in columns}
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i: int) -> dict[str, np.ndarray]:
+        start, stop = self.offsets[i], self.offsets[i + 1]
+        return {col: values[start:stop] for col, values in self.values.items()}
+
+    def apply(
+        self,
+        func: Callable[..., Mapping[str, np.ndarray]],
+        *args,
+        size: int,
+        **kwargs,
+    ) -> pd.DataFrame:
+        """
+        Apply a mapping of arrays -> mapping of arrays to each group.
+
+        `func` may return at most `size` rows per group. The results are
+        stacked with the grouping variables added, like `GroupBy.apply`.
+        """
+        buffers = {}
+        counts = np.zeros(len(self), dtype=np.intp)
+        pos = 0
+        for i in range(len(self)):
+            result = {col: np.asarray(values) for col, values in func(self[i], *args, **kwargs).items()}
+            n = len(next(iter(result.values()), ()))
+            if n > size:
+                raise ValueError(f"Expected at most {size} rows per group, got {n}.")
+            for col, values in result.items():
+                if col not in buffers:
+                    buffers[col] = np.empty(size * len(self), dtype=values.dtype)
+                buffers[col][pos:pos + n] = values
+            counts[i] = n
+            pos += n
+
+        res = pd.DataFrame({col: values[:pos] for col, values in buffers.items()})
+        for var, keys in self.keys.items():
+            res[var] = np.repeat(keys, counts)
+        cols = [c for c in self.data if c in res]
+        cols += [c for c in res if c not in self.data]
+        return res[cols]
+
+    def transform(
+        self,
+        func: Callable[..., Mapping[str, np.ndarray]],
+        *args,
+        **kwargs,
+    ) -> pd.DataFrame:
+        """
+        Apply a mapping of arrays -> mapping of arrays to each group.
+
+        `func` must return one row per input row. The returned columns replace
+        (or are added to) the data, with rows in group order.
+        """
+        buffers = {}
+        for i in range(len(self)):
+            start, stop = self.offsets[i], self.offsets[i + 1]
+            for col, values in func(self[i], *args, **kwargs).items():
+                values = np.asarray(values)
+                if col not in buffers:
+                    buffers[col] = np.empty(len(self.index), dtype=values.dtype)
+                buffers[col][start:stop] = values
+
+        return self.data.take(self.index).reset_index(drop=True).assign(**buffers)
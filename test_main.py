@@ -6,6 +6,9 @@ import seaborn.objects as so
 import seaborn as sns
 import pandas as pd
 import numpy as np
+import statsmodels.api as sm
+from seaborn._core.groupby import GroupBy
+from seaborn_objects_recipes.recipes.split import GroupSplit
 
 
 @pytest.fixture
@@ -170,4 +173,142 @@ def test_polyfit_with_ci(cleanup_files):
     # Save Plot
     plt.savefig("polyfit_with_ci.png")
     # Assert that the file was created
-    assert os.path.exists("polyfit_with_ci.png"), "The plot file lowess.png was not created."
\ No newline at end of file
+    assert os.path.exists("polyfit_with_ci.png"), "The plot file lowess.png was not created."
+
+@pytest.mark.parametrize("it", [0, 2])
+def test_lowess_analytic_ci(it):
+    # Generate data for testing, with a few outliers
+    np.random.seed(0)
+    x = np.random.uniform(0, 2 * np.pi, 200)
+    y = np.sin(x) + np.random.normal(size=200) * 0.2
+    y[::25] += 3
+    data = pd.DataFrame({"x": x, "y": y, "group": np.repeat(["a", "b"], 100)})
+
+    result = sor.Lowess(frac=0.3, it=it, ci_method="analytic")(data, GroupBy(["group"]), "x", {})
+
+    # Each group's curve matches statsmodels fitted on that group and lies inside its band
+    for group, part in data.groupby("group"):
+        rows = result[result["group"] == group]
+        expected = sm.nonparametric.lowess(part["y"], part["x"], frac=0.3, it=it, xvals=rows["x"].to_numpy())
+        np.testing.assert_allclose(rows["y"], expected)
+        assert (rows["ymin"] < rows["y"]).all()
+        assert (rows["y"] < rows["ymax"]).all()
+
+    with pytest.raises(ValueError):
+        sor.Lowess(num_bootstrap=10, ci_method="analytic")
+
+
+@pytest.mark.parametrize("frac, it", [(0.3, 0), (0.3, 2), (0.25, 0), (0.25, 2)])
+def test_lowess_analytic_ci_tied_x(frac, it):
+    # Rounded x values, so windows cut through ties, and half of the points
+    # share x=3 so some windows (k=50 at frac=0.25) hold a single x value
+    np.random.seed(0)
+    x = np.concatenate([np.round(np.random.uniform(0, 10, 100)), np.full(100, 3.0)])
+    data = pd.DataFrame({"x": x, "y": np.sin(x) + np.random.normal(size=200) * 0.3})
+    groupby = GroupBy(["color"])
+
+    analytic = sor.Lowess(frac=frac, it=it, ci_method="analytic")(data, groupby, "x", {})
+    plain = sor.Lowess(frac=frac, it=it)(data, groupby, "x", {})
+
+    # Switching to analytic intervals only adds the band, the curve is unchanged
+    np.testing.assert_allclose(analytic["x"], plain["x"])
+    np.testing.assert_allclose(analytic["y"], plain["y"])
+
+
+def test_lowess_analytic_ci_alpha():
+    np.random.seed(0)
+    x = np.random.uniform(0, 10, 100)
+    data = pd.DataFrame({"x": x, "y": np.cos(x) + np.random.normal(size=100) * 0.5})
+
+    widths = [
+        (res["ymax"] - res["ymin"]).to_numpy()
+        for res in (
+            sor.Lowess(alpha=alpha, ci_method="analytic")(data, GroupBy(["color"]), "x", {})
+            for alpha in (0.5, 0.9, 0.99)
+        )
+    ]
+
+    # A higher confidence level gives a wider band everywhere
+    assert (widths[0] < widths[1]).all()
+    assert (widths[1] < widths[2]).all()
+
+
+def test_rolling_matches_groupby_apply(sample_data):
+    data = sample_data.rename(columns={"Iteration": "x", "Episodic Return": "y", "Agent": "color"})
+    data = data[["x", "y", "color"]].sample(frac=1, random_state=0)
+    groupby = GroupBy(["color"])
+    rolling = sor.Rolling(window_type="gaussian", window_kwargs={"std": 2})
+
+    def apply_rolling(df, var):
+        df = df.copy()
+        df[var] = df[var].rolling(window=2, min_periods=1, win_type="gaussian", closed="neither").mean(std=2)
+        return df
+
+    # The split utility gives the same rows, in the same order, as seaborn's GroupBy.apply
+    expected = groupby.apply(data, apply_rolling, "y")
+    pd.testing.assert_frame_equal(rolling(data, groupby, "x", {}), expected)
+
+
+@pytest.fixture
+def grouped_data():
+    np.random.seed(0)
+    return pd.DataFrame({
+        "x": np.random.uniform(0, 10, 120),
+        "y": np.random.normal(size=120),
+        "color": np.random.choice(["a", "b", None], 120),
+        "marker": np.random.choice(["o", "s"], 120),
+    })
+
+
+@pytest.fixture
+def grouped_by():
+    # Explicit order with an unused level, two grouping variables and one
+    # that is absent from the data
+    return GroupBy({"color": ["b", "a", "c"], "marker": None, "linestyle": None})
+
+
+def test_group_split_matches_groupby_apply(grouped_data, grouped_by):
+    split = GroupSplit(grouped_by, grouped_data, ["y"])
+
+    # Each group is a view into the contiguous, group-sorted arrays
+    assert np.shares_memory(split[0]["y"], split.values["y"])
+
+    expected = grouped_by.apply(grouped_data, lambda df: df.assign(y=df["y"].cumsum()))
+    result = split.transform(lambda part: {"y": np.cumsum(part["y"])})
+    pd.testing.assert_frame_equal(result, expected)
+
+    expected = grouped_by.apply(grouped_data, lambda df: pd.DataFrame({"y": [df["y"].min(), df["y"].max()]}))
+    result = split.apply(lambda part: {"y": [part["y"].min(), part["y"].max()]}, size=2)
+    pd.testing.assert_frame_equal(result, expected)
+
+    # Rows with a missing group key are dropped
+    assert len(split.index) == grouped_data["color"].notna().sum()
+
+
+def test_group_split_empty(grouped_data, grouped_by):
+    empty = grouped_data.iloc[:0]
+    split = GroupSplit(grouped_by, empty, ["y"])
+
+    assert len(split) == 0
+    assert split.apply(lambda part: {"y": part["y"][:1]}, size=1).empty
+    pd.testing.assert_frame_equal(split.transform(lambda part: part), empty.reset_index(drop=True))
+
+
+@pytest.mark.parametrize("stat", [sor.Lowess(frac=0.5, gridsize=20), sor.PolyFitWithCI(gridsize=20)])
+def test_stats_match_groupby_apply(grouped_data, grouped_by, stat):
+    expected = grouped_by.apply(grouped_data, lambda df: pd.DataFrame(stat._fit_predict(df)))
+    pd.testing.assert_frame_equal(stat(grouped_data, grouped_by, "x", {}), expected)
+
+
+def test_polyfit_with_ci_small_group():
+    data = pd.DataFrame({
+        "x": [0.0, 1.0, 2.0, 3.0, 0.0, 1.0],
+        "y": [1.0, 0.0, 1.0, 4.0, 2.0, 3.0],
+        "color": ["a", "a", "a", "a", "b", "b"],
+    })
+
+    result = sor.PolyFitWithCI(order=2, gridsize=10)(data, GroupBy(["color"]), "x", {})
+
+    # Group "b" has too few points for a quadratic fit and contributes no rows
+    assert len(result) == 10
+    assert (result["color"] == "a").all()